@@ -3,5 +3,6 @@
 # with no dependencies on external frameworks or infrastructure
 
 # Import and expose key core modules and interfaces
-from core.repositories import Repository, WorkshopRepository, BookingRepository, GuardianRepository
+from core.errors import ErrorCode
+from core.repositories import Repository, RepositoryError, WorkshopRepository, BookingRepository, GuardianRepository
 from core.unit_of_work import UnitOfWork, execute_in_transaction 
\ No newline at end of file
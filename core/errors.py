@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class ErrorCode(Enum):
+    """
+    Machine-readable reason a use case failed.
+    Returned alongside the human-readable error message in output DTOs,
+    so callers can branch on the kind of failure without parsing text.
+    """
+    INVALID_INPUT = "invalid_input"
+    NOT_FOUND = "not_found"
+    INSUFFICIENT_CAPACITY = "insufficient_capacity"
+    REPOSITORY_FAILURE = "repository_failure"
+    UNEXPECTED_ERROR = "unexpected_error"
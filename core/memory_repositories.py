@@ -1,5 +1,6 @@
 from typing import List, Dict, Optional, TypeVar, Generic, Type
 from copy import deepcopy
+from datetime import date, time
 
 from core.repositories import Repository, WorkshopRepository, BookingRepository, GuardianRepository
 from core.workshops.WorkshopEntity import WorkshopEntity
@@ -58,6 +59,13 @@ class InMemoryRepository(Generic[T], Repository[T]):
             del self._entities[id]
             return True
         return False
+    
+    def clear(self) -> None:
+        """
+        Remove all entities and restart ID assignment.
+        """
+        self._entities.clear()
+        self._next_id = 1
 
 
 class InMemoryWorkshopRepository(InMemoryRepository[WorkshopEntity], WorkshopRepository):
@@ -67,6 +75,17 @@ class InMemoryWorkshopRepository(InMemoryRepository[WorkshopEntity], WorkshopRep
     
     def __init__(self):
         super().__init__(WorkshopEntity)
+    
+    def get_available(self, on_or_after: date) -> List[WorkshopEntity]:
+        """
+        Get all dated workshops on or after a date, ordered by date, then time.
+        """
+        upcoming = [
+            workshop for workshop in self._entities.values()
+            if workshop.date is not None and workshop.date >= on_or_after
+        ]
+        upcoming.sort(key=lambda w: (w.date, w.time or time.min))
+        return [deepcopy(workshop) for workshop in upcoming]
 
 
 class InMemoryBookingRepository(InMemoryRepository[BookingEntity], BookingRepository):
@@ -59,6 +59,21 @@ class InMemoryUnitOfWork(UnitOfWork):
         
         self._is_active = False
     
+    def reset(self):
+        """
+        Empty every repository and discard any open transaction,
+        so one instance can be reused from a clean state.
+        """
+        self._workshops.clear()
+        self._bookings.clear()
+        self._guardians.clear()
+        
+        self._workshop_snapshots = {}
+        self._booking_snapshots = {}
+        self._guardian_snapshots = {}
+        
+        self._is_active = False
+    
     def _take_snapshots(self):
         """
         Take snapshots of all repositories for potential rollback.
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Optional, TypeVar, Generic
 
 # Define entity type variable for generic repository
 T = TypeVar('T')
 
+
+class RepositoryError(Exception):
+    """
+    Raised by repository implementations when the underlying storage fails.
+    Use cases catch it to report a failure instead of crashing.
+    """
+    pass
+
+
 class Repository(Generic[T], ABC):
     """
     Abstract base class for repositories, following the Repository pattern.
@@ -59,14 +69,39 @@ class Repository(Generic[T], ABC):
             True if successful, False otherwise
         """
         pass
+    
+    def delete_many(self, ids: List[int]) -> int:
+        """
+        Delete several entities by their IDs.
+        Implementations may override this with a batched delete.
+        
+        Args:
+            ids: The IDs of the entities to delete
+            
+        Returns:
+            The number of entities that were deleted
+        """
+        return sum(1 for id in ids if self.delete(id))
 
 
 class WorkshopRepository(Repository['WorkshopEntity'], ABC):
     """
     Workshop-specific repository interface that extends the base Repository interface.
-    May add workshop-specific query methods.
     """
-    pass
+    
+    @abstractmethod
+    def get_available(self, on_or_after: date) -> List['WorkshopEntity']:
+        """
+        Get all workshops taking place on or after a given date.
+        Workshops without a date are never included.
+        
+        Args:
+            on_or_after: The earliest workshop date to include (inclusive)
+            
+        Returns:
+            A list of workshops ordered by date, then time, with untimed workshops first
+        """
+        pass
 
 
 class BookingRepository(Repository['BookingEntity'], ABC):
@@ -1,24 +1,24 @@
+from dataclasses import dataclass
+from datetime import date as date_type, time as time_type
+from typing import Optional
+
+
+@dataclass(eq=False, slots=True)
 class WorkshopEntity:
     """
     WorkshopEntity represents the core business concept of a workshop.
     This is a pure entity class following clean architecture principles.
     It has no dependencies on frameworks, UI, database, or other external systems.
     """
-    
-    def __init__(self, id=None, title="", date=None, time=None, location="", 
-                 max_families=0, max_children=0, current_families=0, current_children=0):
-        """
-        Initialize a new Workshop entity
-        """
-        self.id = id
-        self.title = title
-        self.date = date
-        self.time = time
-        self.location = location
-        self.max_families = max_families
-        self.max_children = max_children
-        self.current_families = current_families
-        self.current_children = current_children
+    id: Optional[int] = None
+    title: str = ""
+    date: Optional[date_type] = None
+    time: Optional[time_type] = None
+    location: str = ""
+    max_families: int = 0
+    max_children: int = 0
+    current_families: int = 0
+    current_children: int = 0
     
     def has_family_capacity(self):
         """
@@ -109,9 +109,8 @@ class DeleteWorkshopUseCase:
                     for item in guardian_map.values()
                 ]
                 
-                # Delete all bookings for this workshop
-                for booking in bookings:
-                    self.booking_repository.delete(booking.id)
+                # Delete all bookings for this workshop in one batch
+                self.booking_repository.delete_many([booking.id for booking in bookings])
             
             # Delete the workshop
             self.workshop_repository.delete(workshop.id)
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import date, time
 from typing import Optional, List
 
+from core.errors import ErrorCode
+from core.repositories import RepositoryError
 from core.workshops.WorkshopEntity import WorkshopEntity
 
 
@@ -41,6 +43,7 @@ class EditWorkshopOutputDTO:
     workshop_id: Optional[int] = None
     affected_bookings: Optional[List[AffectedBookingDTO]] = None
     error_message: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
 
 
 class EditWorkshopUseCase:
@@ -76,7 +79,8 @@ class EditWorkshopUseCase:
             if not self._validate_input(input_dto):
                 return EditWorkshopOutputDTO(
                     success=False,
-                    error_message="Invalid workshop data provided"
+                    error_message="Invalid workshop data provided",
+                    error_code=ErrorCode.INVALID_INPUT
                 )
             
             # Retrieve the workshop to edit
@@ -84,7 +88,8 @@ class EditWorkshopUseCase:
             if not workshop:
                 return EditWorkshopOutputDTO(
                     success=False,
-                    error_message=f"Workshop with ID {input_dto.workshop_id} not found"
+                    error_message=f"Workshop with ID {input_dto.workshop_id} not found",
+                    error_code=ErrorCode.NOT_FOUND
                 )
             
             # Check if slots are being reduced
@@ -135,11 +140,19 @@ class EditWorkshopUseCase:
                 affected_bookings=affected_bookings if affected_bookings else None
             )
             
-        except Exception as e:
+        except RepositoryError as e:
             # Return failure response
             return EditWorkshopOutputDTO(
                 success=False,
-                error_message=f"Failed to edit workshop: {str(e)}"
+                error_message=f"Failed to edit workshop: {str(e)}",
+                error_code=ErrorCode.REPOSITORY_FAILURE
+            )
+        except Exception as e:
+            # Return failure response for errors outside the repository
+            return EditWorkshopOutputDTO(
+                success=False,
+                error_message=f"Failed to edit workshop: {str(e)}",
+                error_code=ErrorCode.UNEXPECTED_ERROR
             )
     
     def _validate_input(self, input_dto: EditWorkshopInputDTO) -> bool:
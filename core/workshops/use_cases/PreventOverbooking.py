@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from core.errors import ErrorCode
+from core.repositories import RepositoryError
+
 
 @dataclass
 class PreventOverbookingInputDTO:
@@ -23,6 +26,7 @@ class PreventOverbookingOutputDTO:
     remaining_family_slots: Optional[int] = None
     remaining_child_slots: Optional[int] = None
     error_message: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
 
 
 class PreventOverbookingUseCase:
@@ -57,7 +61,8 @@ class PreventOverbookingUseCase:
             if not self._validate_input(input_dto):
                 return PreventOverbookingOutputDTO(
                     has_capacity=False,
-                    error_message="Invalid booking request data provided"
+                    error_message="Invalid booking request data provided",
+                    error_code=ErrorCode.INVALID_INPUT
                 )
             
             # Retrieve the workshop to check
@@ -65,7 +70,8 @@ class PreventOverbookingUseCase:
             if not workshop:
                 return PreventOverbookingOutputDTO(
                     has_capacity=False,
-                    error_message=f"Workshop with ID {input_dto.workshop_id} not found"
+                    error_message=f"Workshop with ID {input_dto.workshop_id} not found",
+                    error_code=ErrorCode.NOT_FOUND
                 )
             
             # Calculate remaining slots
@@ -78,7 +84,8 @@ class PreventOverbookingUseCase:
                     has_capacity=False,
                     remaining_family_slots=remaining_family_slots,
                     remaining_child_slots=remaining_child_slots,
-                    error_message=f"Not enough family slots available. Requested: {input_dto.requested_family_slots}, Available: {remaining_family_slots}"
+                    error_message=f"Not enough family slots available. Requested: {input_dto.requested_family_slots}, Available: {remaining_family_slots}",
+                    error_code=ErrorCode.INSUFFICIENT_CAPACITY
                 )
             
             # Check if there's enough capacity for children
@@ -87,7 +94,8 @@ class PreventOverbookingUseCase:
                     has_capacity=False,
                     remaining_family_slots=remaining_family_slots,
                     remaining_child_slots=remaining_child_slots,
-                    error_message=f"Not enough child slots available. Requested: {input_dto.requested_child_slots}, Available: {remaining_child_slots}"
+                    error_message=f"Not enough child slots available. Requested: {input_dto.requested_child_slots}, Available: {remaining_child_slots}",
+                    error_code=ErrorCode.INSUFFICIENT_CAPACITY
                 )
             
             # All checks passed, there is enough capacity
@@ -97,11 +105,19 @@ class PreventOverbookingUseCase:
                 remaining_child_slots=remaining_child_slots
             )
             
-        except Exception as e:
+        except RepositoryError as e:
             # Return failure response
             return PreventOverbookingOutputDTO(
                 has_capacity=False,
-                error_message=f"Failed to check workshop capacity: {str(e)}"
+                error_message=f"Failed to check workshop capacity: {str(e)}",
+                error_code=ErrorCode.REPOSITORY_FAILURE
+            )
+        except Exception as e:
+            # Return failure response for errors outside the repository
+            return PreventOverbookingOutputDTO(
+                has_capacity=False,
+                error_message=f"Failed to check workshop capacity: {str(e)}",
+                error_code=ErrorCode.UNEXPECTED_ERROR
             )
     
     def _validate_input(self, input_dto: PreventOverbookingInputDTO) -> bool:
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from core.errors import ErrorCode
+from core.repositories import RepositoryError
+
 
 @dataclass
 class UpdateWorkshopAvailabilityInputDTO:
@@ -26,6 +29,7 @@ class UpdateWorkshopAvailabilityOutputDTO:
     remaining_family_slots: Optional[int] = None
     remaining_child_slots: Optional[int] = None
     error_message: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
 
 
 class UpdateWorkshopAvailabilityUseCase:
@@ -60,7 +64,8 @@ class UpdateWorkshopAvailabilityUseCase:
             if not self._validate_input(input_dto):
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message="Invalid input data provided"
+                    error_message="Invalid input data provided",
+                    error_code=ErrorCode.INVALID_INPUT
                 )
             
             # Retrieve the workshop to update
@@ -68,7 +73,8 @@ class UpdateWorkshopAvailabilityUseCase:
             if not workshop:
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message=f"Workshop with ID {input_dto.workshop_id} not found"
+                    error_message=f"Workshop with ID {input_dto.workshop_id} not found",
+                    error_code=ErrorCode.NOT_FOUND
                 )
             
             # Calculate new values
@@ -79,25 +85,29 @@ class UpdateWorkshopAvailabilityUseCase:
             if new_current_families < 0:
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message=f"Cannot have negative family slots used ({new_current_families})"
+                    error_message=f"Cannot have negative family slots used ({new_current_families})",
+                    error_code=ErrorCode.INVALID_INPUT
                 )
             
             if new_current_children < 0:
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message=f"Cannot have negative child slots used ({new_current_children})"
+                    error_message=f"Cannot have negative child slots used ({new_current_children})",
+                    error_code=ErrorCode.INVALID_INPUT
                 )
             
             if new_current_families > workshop.max_families:
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message=f"Not enough family slots available (requested: {new_current_families}, max: {workshop.max_families})"
+                    error_message=f"Not enough family slots available (requested: {new_current_families}, max: {workshop.max_families})",
+                    error_code=ErrorCode.INSUFFICIENT_CAPACITY
                 )
             
             if new_current_children > workshop.max_children:
                 return UpdateWorkshopAvailabilityOutputDTO(
                     success=False,
-                    error_message=f"Not enough child slots available (requested: {new_current_children}, max: {workshop.max_children})"
+                    error_message=f"Not enough child slots available (requested: {new_current_children}, max: {workshop.max_children})",
+                    error_code=ErrorCode.INSUFFICIENT_CAPACITY
                 )
             
             # Update workshop availability
@@ -115,11 +125,19 @@ class UpdateWorkshopAvailabilityUseCase:
                 remaining_child_slots=updated_workshop.remaining_child_slots()
             )
             
-        except Exception as e:
+        except RepositoryError as e:
             # Return failure response
             return UpdateWorkshopAvailabilityOutputDTO(
                 success=False,
-                error_message=f"Failed to update workshop availability: {str(e)}"
+                error_message=f"Failed to update workshop availability: {str(e)}",
+                error_code=ErrorCode.REPOSITORY_FAILURE
+            )
+        except Exception as e:
+            # Return failure response for errors outside the repository
+            return UpdateWorkshopAvailabilityOutputDTO(
+                success=False,
+                error_message=f"Failed to update workshop availability: {str(e)}",
+                error_code=ErrorCode.UNEXPECTED_ERROR
             )
     
     def _validate_input(self, input_dto: UpdateWorkshopAvailabilityInputDTO) -> bool:
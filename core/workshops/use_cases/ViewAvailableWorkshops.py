@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from datetime import date, time
 from typing import List, Optional
 
+from core.errors import ErrorCode
+from core.repositories import RepositoryError
+
 
 @dataclass
 class WorkshopSummaryDTO:
@@ -36,6 +39,7 @@ class ViewAvailableWorkshopsOutputDTO:
     success: bool
     workshops: List[WorkshopSummaryDTO] = None
     error_message: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
 
 
 class ViewAvailableWorkshopsUseCase:
@@ -66,14 +70,9 @@ class ViewAvailableWorkshopsUseCase:
             ViewAvailableWorkshopsOutputDTO: The result of the operation
         """
         try:
-            # Retrieve all workshops from the repository
-            all_workshops = self.workshop_repository.get_all()
-            
-            # Filter for upcoming workshops (workshop date >= current date)
-            upcoming_workshops = [
-                workshop for workshop in all_workshops 
-                if workshop.date >= input_dto.current_date
-            ]
+            # Retrieve upcoming workshops (workshop date >= current date),
+            # already ordered by date, then time, from the repository
+            upcoming_workshops = self.workshop_repository.get_available(input_dto.current_date)
             
             # Convert to DTOs for the presentation layer
             workshop_dtos = [
@@ -89,18 +88,23 @@ class ViewAvailableWorkshopsUseCase:
                 for workshop in upcoming_workshops
             ]
             
-            # Sort workshops by date, then time
-            workshop_dtos.sort(key=lambda w: (w.workshop_date, w.workshop_time))
-            
             # Return success response with the workshop list
             return ViewAvailableWorkshopsOutputDTO(
                 success=True,
                 workshops=workshop_dtos
             )
             
-        except Exception as e:
+        except RepositoryError as e:
             # Return failure response
             return ViewAvailableWorkshopsOutputDTO(
                 success=False,
-                error_message=f"Failed to retrieve workshops: {str(e)}"
-            ) 
\ No newline at end of file
+                error_message=f"Failed to retrieve workshops: {str(e)}",
+                error_code=ErrorCode.REPOSITORY_FAILURE
+            )
+        except Exception as e:
+            # Return failure response for errors outside the repository
+            return ViewAvailableWorkshopsOutputDTO(
+                success=False,
+                error_message=f"Failed to retrieve workshops: {str(e)}",
+                error_code=ErrorCode.UNEXPECTED_ERROR
+            )
\ No newline at end of file
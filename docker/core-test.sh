@@ -1,6 +1,12 @@
 #!/bin/bash
 set -e
 
+# The core entities use slotted dataclasses, which need Python 3.10 or newer
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))'; then
+    echo "Python 3.10 or newer is required, found $(python3 --version 2>&1)." >&2
+    exit 1
+fi
+
 # Build the core container to verify it's isolated and properly built
 echo "Building core container..."
 docker-compose -f docker/docker-compose.yml build
@@ -9,13 +15,14 @@ docker-compose -f docker/docker-compose.yml build
 if [ ! -d "venv" ]; then
     echo "Creating virtual environment..."
     python3 -m venv venv
-    source venv/bin/activate
-    pip install pytest pytest-cov
-else
-    echo "Activating virtual environment..."
-    source venv/bin/activate
 fi
 
+echo "Activating virtual environment..."
+source venv/bin/activate
+
+# Install the pinned test requirements, so existing environments pick up new ones too
+pip install -q -r requirements.txt
+
 # Run tests from outside the container against the core domain
 # This follows Clean Architecture by keeping tests independent of infrastructure
 echo "Running tests against core domain..."
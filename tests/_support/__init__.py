@@ -0,0 +1 @@
+# This file marks tests._support as a Python package
@@ -0,0 +1,138 @@
+"""
+Hand-written repository mocks shared by the workshop use case tests.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import List, Optional
+
+from core.repositories import RepositoryError
+from core.workshops.WorkshopEntity import WorkshopEntity
+
+
+class MockBooking:
+    """Simple mock booking class for testing."""
+    def __init__(self, id, workshop_id, guardian_id, children=None):
+        self.id = id
+        self.workshop_id = workshop_id
+        self.guardian_id = guardian_id
+        self.children = children or []
+
+    def child_count(self):
+        return len(self.children)
+
+
+class MockGuardian:
+    """Simple mock guardian class for testing."""
+    def __init__(self, id, name, email):
+        self.id = id
+        self.name = name
+        self.email = email
+
+
+class MockWorkshopRepository:
+    """
+    Mock workshop repository shared by the workshop use case tests.
+    """
+    __slots__ = ("workshops", "should_fail", "deleted_ids")
+
+    def __init__(self, workshops_map=None, should_fail=False):
+        self.workshops = workshops_map if workshops_map is not None else {}
+        self.should_fail = should_fail
+        self.deleted_ids = []
+
+    def get_by_id(self, workshop_id) -> Optional[WorkshopEntity]:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        return self.workshops.get(workshop_id)
+
+    def update(self, workshop) -> WorkshopEntity:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        self.workshops[workshop.id] = workshop
+        return workshop
+
+    def delete(self, workshop_id) -> bool:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        if workshop_id in self.workshops:
+            del self.workshops[workshop_id]
+            self.deleted_ids.append(workshop_id)
+            return True
+
+        return False
+
+    @contextmanager
+    def failing(self):
+        """
+        Make every call fail inside the block, then restore the previous behaviour.
+        """
+        previous = self.should_fail
+        self.should_fail = True
+        try:
+            yield self
+        finally:
+            self.should_fail = previous
+
+
+class MockBookingRepository:
+    """
+    Mock booking repository shared by the workshop use case tests.
+    Bookings and guardians are indexed once up front so every lookup is a dict access.
+    """
+    __slots__ = ("_by_id", "_by_workshop", "_guardians_by_id", "should_fail", "deleted_booking_ids")
+
+    def __init__(self, bookings=None, guardians=None, should_fail=False):
+        self._by_id = {}
+        self._by_workshop = defaultdict(list)
+        for booking in bookings or []:
+            self._by_id[booking.id] = booking
+            self._by_workshop[booking.workshop_id].append(booking)
+
+        self._guardians_by_id = {g.id: g for g in (guardians or [])}
+        self.should_fail = should_fail
+        self.deleted_booking_ids = []
+
+    def get_by_workshop_id(self, workshop_id) -> List[MockBooking]:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        return list(self._by_workshop.get(workshop_id, ()))
+
+    def get_guardian_for_booking(self, booking_id) -> Optional[MockGuardian]:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        booking = self._by_id.get(booking_id)
+        if not booking:
+            return None
+
+        return self._guardians_by_id.get(booking.guardian_id)
+
+    def delete(self, booking_id) -> bool:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        booking = self._by_id.pop(booking_id, None)
+        if booking is None:
+            return False
+
+        self._by_workshop[booking.workshop_id].remove(booking)
+        self.deleted_booking_ids.append(booking_id)
+        return True
+
+    def delete_many(self, booking_ids) -> int:
+        if self.should_fail:
+            raise RepositoryError("Mock repository failure")
+
+        removed = [self._by_id.pop(booking_id) for booking_id in booking_ids if booking_id in self._by_id]
+        removed_ids = {booking.id for booking in removed}
+        for workshop_id in {booking.workshop_id for booking in removed}:
+            self._by_workshop[workshop_id] = [
+                b for b in self._by_workshop[workshop_id] if b.id not in removed_ids
+            ]
+
+        self.deleted_booking_ids.extend(booking.id for booking in removed)
+        return len(removed)
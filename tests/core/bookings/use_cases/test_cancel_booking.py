@@ -1,6 +1,6 @@
 import unittest
 from datetime import date, time
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from core.bookings.BookingEntity import BookingEntity, Child
 from core.guardians.GuardianEntity import GuardianEntity
@@ -1,6 +1,6 @@
 import unittest
 from datetime import date, time
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from core.bookings.BookingEntity import BookingEntity
 from core.bookings.use_cases.CreateBooking import (
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 
 from core.guardians.GuardianEntity import GuardianEntity
 from core.bookings.BookingEntity import BookingEntity
@@ -10,12 +10,36 @@ from core.guardians.use_cases.LinkBookingsToGuardians import (
 )
 
 
+# Test bookings as (id, workshop_id, guardian_id) rows
+_BOOKING_ROWS = (
+    (1, 1, None),  # Not linked to a guardian yet
+    (2, 1, None),  # Not linked to a guardian yet
+    (3, 2, 2),     # Already linked to a different guardian
+)
+
+
+class FakeBookingRepository:
+    """Fake booking repository that counts saves for the LinkBookingsToGuardians use case."""
+    
+    def __init__(self):
+        self.get_by_id = Mock()
+        self.save_count = 0
+        self.save_error = None
+    
+    def save(self, booking):
+        if self.save_error:
+            raise self.save_error
+        
+        self.save_count += 1
+        return None
+
+
 class MockUnitOfWork:
     """Mock UnitOfWork for testing the LinkBookingsToGuardians use case."""
     
     def __init__(self):
         self.guardians = Mock()
-        self.bookings = Mock()
+        self.bookings = FakeBookingRepository()
         self.entered = False
         self.exited = False
         self.commit_called = False
@@ -56,40 +80,18 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
             postcode="12345"
         )
         
-        # Create some test bookings
-        self.booking1 = BookingEntity(
-            id=1,
-            workshop_id=1,
-            guardian_id=None  # Not linked to a guardian yet
-        )
-        
-        self.booking2 = BookingEntity(
-            id=2,
-            workshop_id=1,
-            guardian_id=None  # Not linked to a guardian yet
-        )
-        
-        self.booking3 = BookingEntity(
-            id=3,
-            workshop_id=2,
-            guardian_id=2  # Already linked to a different guardian
-        )
+        # Create fresh test bookings, since the use case links them in place
+        self._bookings_by_id = {
+            booking_id: BookingEntity(id=booking_id, workshop_id=workshop_id, guardian_id=guardian_id)
+            for booking_id, workshop_id, guardian_id in _BOOKING_ROWS
+        }
+        self.booking1 = self._bookings_by_id[1]
+        self.booking2 = self._bookings_by_id[2]
+        self.booking3 = self._bookings_by_id[3]
         
         # Configure the mocks to return our test entities
         self.unit_of_work.guardians.get_by_id = Mock(return_value=self.guardian)
-        self.unit_of_work.bookings.get_by_id = Mock(side_effect=self._mock_get_booking_by_id)
-        self.unit_of_work.bookings.save = Mock(return_value=None)
-    
-    def _mock_get_booking_by_id(self, booking_id):
-        """Helper method to mock the get_by_id method of booking repository."""
-        if booking_id == 1:
-            return self.booking1
-        elif booking_id == 2:
-            return self.booking2
-        elif booking_id == 3:
-            return self.booking3
-        else:
-            return None
+        self.unit_of_work.bookings.get_by_id.side_effect = self._bookings_by_id.get
     
     def test_link_bookings_to_guardian_success(self):
         """
@@ -117,7 +119,7 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
         self.unit_of_work.bookings.get_by_id.assert_any_call(2)
         
         # Verify the bookings were saved
-        self.assertEqual(self.unit_of_work.bookings.save.call_count, 2)
+        self.assertEqual(self.unit_of_work.bookings.save_count, 2)
         
         # Verify the bookings were linked to the guardian
         self.assertEqual(self.booking1.guardian_id, 1)
@@ -154,7 +156,7 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
         self.unit_of_work.guardians.get_by_id.assert_called_once_with(999)
         
         # Verify no bookings were saved
-        self.unit_of_work.bookings.save.assert_not_called()
+        self.assertEqual(self.unit_of_work.bookings.save_count, 0)
         
         # Verify transaction was managed correctly
         self.assertTrue(self.unit_of_work.entered)
@@ -184,7 +186,7 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
         self.unit_of_work.bookings.get_by_id.assert_any_call(999)
         
         # Verify only the first booking was saved
-        self.assertEqual(self.unit_of_work.bookings.save.call_count, 1)
+        self.assertEqual(self.unit_of_work.bookings.save_count, 1)
         
         # Verify the first booking was linked to the guardian
         self.assertEqual(self.booking1.guardian_id, 1)
@@ -217,7 +219,7 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
         self.unit_of_work.bookings.get_by_id.assert_any_call(3)
         
         # Verify only the first booking was saved
-        self.assertEqual(self.unit_of_work.bookings.save.call_count, 1)
+        self.assertEqual(self.unit_of_work.bookings.save_count, 1)
         
         # Verify the first booking was linked to the guardian
         self.assertEqual(self.booking1.guardian_id, 1)
@@ -248,14 +250,14 @@ class TestLinkBookingsToGuardiansUseCase(unittest.TestCase):
         # Verify no repositories were called
         self.unit_of_work.guardians.get_by_id.assert_not_called()
         self.unit_of_work.bookings.get_by_id.assert_not_called()
-        self.unit_of_work.bookings.save.assert_not_called()
+        self.assertEqual(self.unit_of_work.bookings.save_count, 0)
     
     def test_repository_failure(self):
         """
         Test handling of repository failures.
         """
         # Configure the booking repository's save method to raise an exception
-        self.unit_of_work.bookings.save = Mock(side_effect=Exception("Database error"))
+        self.unit_of_work.bookings.save_error = Exception("Database error")
         
         # Create valid input DTO
         input_dto = LinkBookingsToGuardiansInputDTO(
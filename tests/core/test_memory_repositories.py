@@ -0,0 +1,47 @@
+"""
+Test the in-memory repository implementations.
+"""
+from datetime import date, time
+
+import pytest
+
+from core.memory_repositories import InMemoryWorkshopRepository
+from core.workshops.WorkshopEntity import WorkshopEntity
+
+
+@pytest.fixture
+def workshops():
+    """
+    Create an empty in-memory workshop repository for each test
+    """
+    return InMemoryWorkshopRepository()
+
+
+def test_delete_many(workshops):
+    """
+    Test that delete_many removes every given entity and skips unknown IDs.
+    """
+    first = workshops.save(WorkshopEntity(title="First"))
+    second = workshops.save(WorkshopEntity(title="Second"))
+    kept = workshops.save(WorkshopEntity(title="Kept"))
+
+    deleted = workshops.delete_many([first.id, second.id, 999])
+
+    assert deleted == 2
+    assert [w.id for w in workshops.get_all()] == [kept.id]
+
+
+def test_get_available(workshops):
+    """
+    Test that get_available skips past and undated workshops and orders the rest by date, then time.
+    """
+    workshops.save(WorkshopEntity(title="Past", date=date(2022, 12, 31), time=time(10, 0)))
+    workshops.save(WorkshopEntity(title="Undated"))
+    later = workshops.save(WorkshopEntity(title="Later", date=date(2023, 6, 1), time=time(9, 0)))
+    afternoon = workshops.save(WorkshopEntity(title="Afternoon", date=date(2023, 1, 1), time=time(14, 0)))
+    untimed = workshops.save(WorkshopEntity(title="Untimed", date=date(2023, 1, 1)))
+    morning = workshops.save(WorkshopEntity(title="Morning", date=date(2023, 1, 1), time=time(9, 0)))
+
+    available = workshops.get_available(date(2023, 1, 1))
+
+    assert [w.id for w in available] == [untimed.id, morning.id, afternoon.id, later.id]
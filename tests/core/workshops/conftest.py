@@ -0,0 +1,24 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from core.repositories import WorkshopRepository
+
+
+@pytest.fixture(scope="module")
+def workshop_repo_spec():
+    """
+    Build the autospecced workshop repository once per module,
+    so the spec introspection is not repeated for every test.
+    """
+    return create_autospec(WorkshopRepository, instance=True)
+
+
+@pytest.fixture
+def mock_workshop_repo(workshop_repo_spec):
+    """
+    Provide the shared autospecced workshop repository with the previous
+    test's calls, return values and side effects cleared.
+    """
+    workshop_repo_spec.reset_mock(return_value=True, side_effect=True)
+    return workshop_repo_spec
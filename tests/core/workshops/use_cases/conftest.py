@@ -0,0 +1,22 @@
+import pytest
+
+from core.workshops.WorkshopEntity import WorkshopEntity
+
+
+@pytest.fixture(scope="module")
+def base_workshop():
+    """
+    Create a half-booked workshop template, built once per test module.
+    Tests that let a use case mutate it must work on a dataclasses.replace copy.
+    """
+    return WorkshopEntity(
+        id=1,
+        title="Test Workshop",
+        date=None,  # Not relevant for these tests
+        time=None,  # Not relevant for these tests
+        location="Test Location",
+        max_families=10,
+        max_children=20,
+        current_families=5,
+        current_children=10
+    )
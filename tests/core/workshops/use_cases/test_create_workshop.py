@@ -1,8 +1,10 @@
-import unittest
+from dataclasses import replace
 from datetime import date, time
-from unittest.mock import Mock, MagicMock
+from functools import cached_property
+from unittest.mock import NonCallableMock
+
+import pytest
 
-from core.workshops.WorkshopEntity import WorkshopEntity
 from core.workshops.use_cases.CreateWorkshop import (
     CreateWorkshopInputDTO,
     CreateWorkshopOutputDTO,
@@ -12,35 +14,64 @@ from core.unit_of_work import UnitOfWork
 from core.memory_unit_of_work import InMemoryUnitOfWork
 
 
+# The use case only reads its input, so the DTOs are built once per module
+VALID_INPUT = CreateWorkshopInputDTO(
+    title="Test Workshop",
+    workshop_date=date(2023, 12, 1),
+    workshop_time=time(14, 0),
+    location="Test Location",
+    max_families=10,
+    max_children=20
+)
+
+# Each invalid input breaks exactly one field of the valid one
+INVALID_INPUTS = [
+    pytest.param(replace(VALID_INPUT, **{field: bad}), id=case_id)
+    for case_id, field, bad in (
+        ("empty_title", "title", ""),
+        ("empty_location", "location", ""),
+        ("zero_families", "max_families", 0),
+        ("zero_children", "max_children", 0),
+    )
+]
+
+
+class _StubRepo:
+    """
+    Lightweight stand-in for a repository that records every saved entity.
+    Saved entities are also indexed by ID, like the in-memory repositories.
+    """
+    def __init__(self, save_side_effect=None):
+        self.save_calls = []
+        self.entities = {}
+        self.save_side_effect = save_side_effect
+    
+    def save(self, entity):
+        self.save_calls.append(entity)
+        if self.save_side_effect is not None:
+            entity = self.save_side_effect(entity)
+        self.entities[entity.id] = entity
+        return entity
+
+
+def _failing_save(entity):
+    raise Exception("Mock repository failure")
+
+
 class MockUnitOfWork(UnitOfWork):
     """
     Mock UnitOfWork for testing the CreateWorkshop use case.
     """
     def __init__(self, should_fail=False):
-        self._workshops = Mock()
-        self._workshops.save = Mock()
-        self._bookings = Mock()
-        self._guardians = Mock()
-        
-        # Configure workshop repository mock
+        # Configure workshop repository stub
         if should_fail:
-            self._workshops.save.side_effect = Exception("Mock repository failure")
+            self._workshops = _StubRepo(save_side_effect=_failing_save)
         else:
             def save_side_effect(workshop):
-                workshop_copy = WorkshopEntity(
-                    id=1,  # Mocked ID assignment
-                    title=workshop.title,
-                    date=workshop.date,
-                    time=workshop.time,
-                    location=workshop.location,
-                    max_families=workshop.max_families,
-                    max_children=workshop.max_children,
-                    current_families=workshop.current_families,
-                    current_children=workshop.current_children
-                )
-                return workshop_copy
+                workshop.id = 1  # Mocked ID assignment
+                return workshop
             
-            self._workshops.save.side_effect = save_side_effect
+            self._workshops = _StubRepo(save_side_effect=save_side_effect)
         
         # Transaction tracking
         self.commit_called = False
@@ -52,13 +83,15 @@ class MockUnitOfWork(UnitOfWork):
     def workshops(self):
         return self._workshops
     
-    @property
+    # CreateWorkshop never touches bookings or guardians, so these mocks
+    # are only built if a test asks for them
+    @cached_property
     def bookings(self):
-        return self._bookings
+        return NonCallableMock()
     
-    @property
+    @cached_property
     def guardians(self):
-        return self._guardians
+        return NonCallableMock()
     
     def __enter__(self):
         self.entered = True
@@ -76,159 +109,127 @@ class MockUnitOfWork(UnitOfWork):
         self.rollback_called = True
 
 
-class TestCreateWorkshopUseCase(unittest.TestCase):
-    def setUp(self):
-        """
-        Set up the test environment before each test.
-        """
-        self.unit_of_work = MockUnitOfWork()
-        self.use_case = CreateWorkshopUseCase(self.unit_of_work)
-        
-        # Create a valid input DTO for testing
-        self.valid_input = CreateWorkshopInputDTO(
-            title="Test Workshop",
-            workshop_date=date(2023, 12, 1),
-            workshop_time=time(14, 0),
-            location="Test Location",
-            max_families=10,
-            max_children=20
-        )
-    
-    def test_create_workshop_success(self):
-        """
-        Test creating a workshop successfully.
-        """
-        # Execute the use case
-        result = self.use_case.execute(self.valid_input)
-        
-        # Assertions
-        self.assertTrue(result.success)
-        self.assertIsNotNone(result.workshop_id)
-        self.assertEqual(result.workshop_id, 1)
-        self.assertIsNone(result.error_message)
-        
-        # Verify the workshop was saved and transaction was managed correctly
-        self.unit_of_work.workshops.save.assert_called_once()
-        saved_workshop = self.unit_of_work.workshops.save.call_args[0][0]
-        
-        # Check that the saved workshop has the correct properties
-        self.assertEqual(saved_workshop.title, "Test Workshop")
-        self.assertEqual(saved_workshop.date, date(2023, 12, 1))
-        self.assertEqual(saved_workshop.time, time(14, 0))
-        self.assertEqual(saved_workshop.location, "Test Location")
-        self.assertEqual(saved_workshop.max_families, 10)
-        self.assertEqual(saved_workshop.max_children, 20)
-        self.assertEqual(saved_workshop.current_families, 0)
-        self.assertEqual(saved_workshop.current_children, 0)
-        
-        # Verify transaction management
-        self.assertTrue(self.unit_of_work.entered)
-        self.assertTrue(self.unit_of_work.commit_called)
-        self.assertTrue(self.unit_of_work.exited)
-        self.assertFalse(self.unit_of_work.rollback_called)
-    
-    def test_create_workshop_validation_failure(self):
-        """
-        Test that validation fails for invalid input.
-        """
-        # Create invalid inputs to test validation
-        invalid_inputs = [
-            # Empty title
-            CreateWorkshopInputDTO(
-                title="",
-                workshop_date=date(2023, 12, 1),
-                workshop_time=time(14, 0),
-                location="Test Location",
-                max_families=10,
-                max_children=20
-            ),
-            # Empty location
-            CreateWorkshopInputDTO(
-                title="Test Workshop",
-                workshop_date=date(2023, 12, 1),
-                workshop_time=time(14, 0),
-                location="",
-                max_families=10,
-                max_children=20
-            ),
-            # Zero max families
-            CreateWorkshopInputDTO(
-                title="Test Workshop",
-                workshop_date=date(2023, 12, 1),
-                workshop_time=time(14, 0),
-                location="Test Location",
-                max_families=0,
-                max_children=20
-            ),
-            # Zero max children
-            CreateWorkshopInputDTO(
-                title="Test Workshop",
-                workshop_date=date(2023, 12, 1),
-                workshop_time=time(14, 0),
-                location="Test Location",
-                max_families=10,
-                max_children=0
-            ),
-        ]
-        
-        # Test each invalid input
-        for invalid_input in invalid_inputs:
-            result = self.use_case.execute(invalid_input)
-            
-            # Verify validation failure
-            self.assertFalse(result.success)
-            self.assertIsNone(result.workshop_id)
-            self.assertEqual(result.error_message, "Invalid workshop data provided")
-            
-            # Verify save was not called and no transaction was started
-            self.unit_of_work.workshops.save.assert_not_called()
-            self.assertFalse(self.unit_of_work.entered)
-            self.assertFalse(self.unit_of_work.commit_called)
-            
-            # Reset the mock for the next test
-            self.unit_of_work.workshops.save.reset_mock()
-    
-    def test_create_workshop_repository_failure(self):
-        """
-        Test handling of repository failures.
-        """
-        # Create a unit of work that will fail on save
-        failing_unit_of_work = MockUnitOfWork(should_fail=True)
-        failing_use_case = CreateWorkshopUseCase(failing_unit_of_work)
-        
-        # Execute the use case
-        result = failing_use_case.execute(self.valid_input)
-        
-        # Verify failure handling
-        self.assertFalse(result.success)
-        self.assertIsNone(result.workshop_id)
-        self.assertTrue(result.error_message.startswith("Failed to create workshop:"))
-        
-        # Verify transaction management - should have entered but not committed
-        self.assertTrue(failing_unit_of_work.entered)
-        self.assertFalse(failing_unit_of_work.commit_called)
-        self.assertTrue(failing_unit_of_work.exited)
-    
-    def test_with_real_in_memory_unit_of_work(self):
-        """
-        Integration test using the real InMemoryUnitOfWork.
-        """
-        # Create a real InMemoryUnitOfWork
-        real_uow = InMemoryUnitOfWork()
-        real_use_case = CreateWorkshopUseCase(real_uow)
-        
-        # Execute the use case
-        result = real_use_case.execute(self.valid_input)
-        
-        # Verify success
-        self.assertTrue(result.success)
-        self.assertIsNotNone(result.workshop_id)
-        
-        # Verify the workshop was persisted
-        saved_workshop = real_uow.workshops.get_by_id(result.workshop_id)
-        self.assertIsNotNone(saved_workshop)
-        self.assertEqual(saved_workshop.title, "Test Workshop")
+@pytest.fixture
+def unit_of_work():
+    """
+    Create a mock unit of work for each test.
+    """
+    return MockUnitOfWork()
+
+
+@pytest.fixture
+def use_case(unit_of_work):
+    """
+    Create the use case under test.
+    """
+    return CreateWorkshopUseCase(unit_of_work)
+
+
+@pytest.fixture(scope="module")
+def shared_uow():
+    """
+    Create one real InMemoryUnitOfWork for the whole module.
+    """
+    return InMemoryUnitOfWork()
+
+
+@pytest.fixture
+def real_uow(shared_uow):
+    """
+    Hand out the shared real unit of work, emptied again after each test.
+    """
+    yield shared_uow
+    shared_uow.reset()
+
+
+def test_create_workshop_success(unit_of_work, use_case):
+    """
+    Test creating a workshop successfully.
+    """
+    # Execute the use case
+    result = use_case.execute(VALID_INPUT)
+
+    # Assertions
+    assert result.success
+    assert result.workshop_id is not None
+    assert result.workshop_id == 1
+    assert result.error_message is None
+
+    # Verify the workshop was saved and transaction was managed correctly
+    assert len(unit_of_work.workshops.save_calls) == 1
+    saved_workshop = unit_of_work.workshops.entities[1]
+
+    # Check that the saved workshop has the correct properties
+    assert saved_workshop.title == "Test Workshop"
+    assert saved_workshop.date == date(2023, 12, 1)
+    assert saved_workshop.time == time(14, 0)
+    assert saved_workshop.location == "Test Location"
+    assert saved_workshop.max_families == 10
+    assert saved_workshop.max_children == 20
+    assert saved_workshop.current_families == 0
+    assert saved_workshop.current_children == 0
+
+    # Verify transaction management
+    assert unit_of_work.entered
+    assert unit_of_work.commit_called
+    assert unit_of_work.exited
+    assert not unit_of_work.rollback_called
+
+
+@pytest.mark.parametrize("invalid_input", INVALID_INPUTS)
+def test_create_workshop_validation_failure(unit_of_work, use_case, invalid_input):
+    """
+    Test that validation fails for invalid input.
+    """
+    result = use_case.execute(invalid_input)
+
+    # Verify validation failure
+    assert not result.success
+    assert result.workshop_id is None
+    assert result.error_message == "Invalid workshop data provided"
+
+    # Verify save was not called and no transaction was started
+    assert not unit_of_work.workshops.save_calls
+    assert not unit_of_work.entered
+    assert not unit_of_work.commit_called
+
+
+def test_create_workshop_repository_failure():
+    """
+    Test handling of repository failures.
+    """
+    # Create a unit of work that will fail on save
+    failing_unit_of_work = MockUnitOfWork(should_fail=True)
+    failing_use_case = CreateWorkshopUseCase(failing_unit_of_work)
+
+    # Execute the use case
+    result = failing_use_case.execute(VALID_INPUT)
+
+    # Verify failure handling
+    assert not result.success
+    assert result.workshop_id is None
+    assert result.error_message.startswith("Failed to create workshop:")
+
+    # Verify transaction management - should have entered but not committed
+    assert failing_unit_of_work.entered
+    assert not failing_unit_of_work.commit_called
+    assert failing_unit_of_work.exited
+
+
+def test_with_real_in_memory_unit_of_work(real_uow):
+    """
+    Integration test using the real InMemoryUnitOfWork.
+    """
+    real_use_case = CreateWorkshopUseCase(real_uow)
+
+    # Execute the use case
+    result = real_use_case.execute(VALID_INPUT)
 
+    # Verify success
+    assert result.success
+    assert result.workshop_id is not None
 
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    # Verify the workshop was persisted
+    saved_workshop = real_uow.workshops.get_by_id(result.workshop_id)
+    assert saved_workshop is not None
+    assert saved_workshop.title == "Test Workshop"
@@ -1,277 +1,191 @@
-import unittest
-from typing import Optional
+import pytest
 
+from core.errors import ErrorCode
 from core.workshops.WorkshopEntity import WorkshopEntity
 from core.workshops.use_cases.PreventOverbooking import (
     PreventOverbookingInputDTO,
     PreventOverbookingOutputDTO,
     PreventOverbookingUseCase
 )
+from tests._support.mocks import MockWorkshopRepository
 
 
-class MockWorkshopRepository:
+@pytest.fixture(scope="module")
+def workshop_repository(base_workshop):
     """
-    Mock repository for testing the PreventOverbooking use case.
+    Create a repository of workshops with different capacities.
+    PreventOverbooking only reads workshops, so one repository serves the module.
     """
-    def __init__(self, workshops=None, should_fail=False):
-        self.workshops = {w.id: w for w in (workshops or [])}
-        self.should_fail = should_fail
-    
-    def get_by_id(self, workshop_id) -> Optional[WorkshopEntity]:
-        if self.should_fail:
-            raise Exception("Mock repository failure")
-        
-        return self.workshops.get(workshop_id)
+    workshop_full_families = WorkshopEntity(
+        id=2,
+        title="Workshop Full Families",
+        date=None,
+        time=None,
+        location="Test Location 2",
+        max_families=5,
+        max_children=20,
+        current_families=5,  # Full
+        current_children=10
+    )
 
+    workshop_full_children = WorkshopEntity(
+        id=3,
+        title="Workshop Full Children",
+        date=None,
+        time=None,
+        location="Test Location 3",
+        max_families=10,
+        max_children=15,
+        current_families=5,
+        current_children=15  # Full
+    )
 
-class TestPreventOverbookingUseCase(unittest.TestCase):
-    def setUp(self):
-        """
-        Set up the test environment before each test.
-        """
-        # Create test workshops with different capacities
-        self.workshop_with_capacity = WorkshopEntity(
-            id=1,
-            title="Workshop With Capacity",
-            date=None,  # Not relevant for this test
-            time=None,  # Not relevant for this test
-            location="Test Location",
-            max_families=10,
-            max_children=20,
-            current_families=5,
-            current_children=10
-        )
-        
-        self.workshop_full_families = WorkshopEntity(
-            id=2,
-            title="Workshop Full Families",
-            date=None,
-            time=None,
-            location="Test Location 2",
-            max_families=5,
-            max_children=20,
-            current_families=5,  # Full
-            current_children=10
-        )
-        
-        self.workshop_full_children = WorkshopEntity(
-            id=3,
-            title="Workshop Full Children",
-            date=None,
-            time=None,
-            location="Test Location 3",
-            max_families=10,
-            max_children=15,
-            current_families=5,
-            current_children=15  # Full
-        )
-        
-        self.workshop_almost_full = WorkshopEntity(
-            id=4,
-            title="Workshop Almost Full",
-            date=None,
-            time=None,
-            location="Test Location 4",
-            max_families=10,
-            max_children=20,
-            current_families=9,  # Only 1 slot left
-            current_children=18  # Only 2 slots left
-        )
-        
-        # Create repository with test workshops
-        self.workshop_repository = MockWorkshopRepository(workshops=[
-            self.workshop_with_capacity,
-            self.workshop_full_families,
-            self.workshop_full_children,
-            self.workshop_almost_full
-        ])
-        
-        # Create use case
-        self.use_case = PreventOverbookingUseCase(self.workshop_repository)
-    
-    def test_has_capacity_success(self):
-        """
-        Test a booking request when there is sufficient capacity.
-        """
-        # Create input for a valid booking request
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=1,
-            requested_family_slots=2,
-            requested_child_slots=4
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertTrue(result.has_capacity)
-        self.assertEqual(result.remaining_family_slots, 5)  # 10 max - 5 used
-        self.assertEqual(result.remaining_child_slots, 10)  # 20 max - 10 used
-        self.assertIsNone(result.error_message)
-    
-    def test_not_enough_family_slots(self):
-        """
-        Test a booking request when there are not enough family slots.
-        """
-        # Create input requesting more family slots than available
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=2,  # workshop_full_families
-            requested_family_slots=1,  # But 0 available
-            requested_child_slots=2
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertFalse(result.has_capacity)
-        self.assertEqual(result.remaining_family_slots, 0)  # 5 max - 5 used
-        self.assertEqual(result.remaining_child_slots, 10)  # 20 max - 10 used
-        self.assertTrue("Not enough family slots" in result.error_message)
-    
-    def test_not_enough_child_slots(self):
-        """
-        Test a booking request when there are not enough child slots.
-        """
-        # Create input requesting more child slots than available
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=3,  # workshop_full_children
-            requested_family_slots=1,
-            requested_child_slots=1  # But 0 available
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertFalse(result.has_capacity)
-        self.assertEqual(result.remaining_family_slots, 5)  # 10 max - 5 used
-        self.assertEqual(result.remaining_child_slots, 0)  # 15 max - 15 used
-        self.assertTrue("Not enough child slots" in result.error_message)
-    
-    def test_exact_remaining_capacity(self):
-        """
-        Test a booking request that uses the exact remaining capacity.
-        """
-        # Create input that uses all remaining slots
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=4,  # workshop_almost_full
-            requested_family_slots=1,  # Exact remaining amount
-            requested_child_slots=2    # Exact remaining amount
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertTrue(result.has_capacity)
-        self.assertEqual(result.remaining_family_slots, 1)  # 10 max - 9 used
-        self.assertEqual(result.remaining_child_slots, 2)   # 20 max - 18 used
-        self.assertIsNone(result.error_message)
-    
-    def test_exceeding_capacity(self):
-        """
-        Test a booking request that exceeds the remaining capacity.
-        """
-        # Create input that exceeds remaining capacity
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=4,  # workshop_almost_full
-            requested_family_slots=2,  # More than 1 remaining
-            requested_child_slots=1
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertFalse(result.has_capacity)
-        self.assertEqual(result.remaining_family_slots, 1)  # 10 max - 9 used
-        self.assertEqual(result.remaining_child_slots, 2)   # 20 max - 18 used
-        self.assertTrue("Not enough family slots" in result.error_message)
-    
-    def test_workshop_not_found(self):
-        """
-        Test a booking request for a non-existent workshop.
-        """
-        # Create input with non-existent workshop ID
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=999,
-            requested_family_slots=1,
-            requested_child_slots=2
-        )
-        
-        # Execute the use case
-        result = self.use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertFalse(result.has_capacity)
-        self.assertIsNone(result.remaining_family_slots)
-        self.assertIsNone(result.remaining_child_slots)
-        self.assertEqual(result.error_message, "Workshop with ID 999 not found")
-    
-    def test_invalid_input(self):
-        """
-        Test validation failures.
-        """
-        # Test cases with invalid inputs
-        invalid_inputs = [
-            # Invalid workshop ID
-            PreventOverbookingInputDTO(
-                workshop_id=0,
-                requested_family_slots=1,
-                requested_child_slots=2
-            ),
-            # Invalid family slots
-            PreventOverbookingInputDTO(
-                workshop_id=1,
-                requested_family_slots=0,
-                requested_child_slots=2
-            ),
-            # Invalid child slots
-            PreventOverbookingInputDTO(
-                workshop_id=1,
-                requested_family_slots=1,
-                requested_child_slots=0
-            )
-        ]
-        
-        for invalid_input in invalid_inputs:
-            result = self.use_case.execute(invalid_input)
-            
-            # Assertions
-            self.assertFalse(result.has_capacity)
-            self.assertIsNone(result.remaining_family_slots)
-            self.assertIsNone(result.remaining_child_slots)
-            self.assertEqual(result.error_message, "Invalid booking request data provided")
-    
-    def test_repository_failure(self):
-        """
-        Test handling of repository failures.
-        """
-        # Create a repository that will fail
-        failing_repository = MockWorkshopRepository(
-            workshops=[self.workshop_with_capacity], 
-            should_fail=True
-        )
-        
-        failing_use_case = PreventOverbookingUseCase(failing_repository)
-        
-        # Create valid input
-        input_dto = PreventOverbookingInputDTO(
-            workshop_id=1,
-            requested_family_slots=1,
-            requested_child_slots=2
+    workshop_almost_full = WorkshopEntity(
+        id=4,
+        title="Workshop Almost Full",
+        date=None,
+        time=None,
+        location="Test Location 4",
+        max_families=10,
+        max_children=20,
+        current_families=9,  # Only 1 slot left
+        current_children=18  # Only 2 slots left
+    )
+
+    return MockWorkshopRepository(workshops_map={
+        w.id: w for w in (
+            base_workshop,  # Workshop with capacity
+            workshop_full_families,
+            workshop_full_children,
+            workshop_almost_full
         )
-        
-        # Execute the use case
-        result = failing_use_case.execute(input_dto)
-        
-        # Assertions
-        self.assertFalse(result.has_capacity)
-        self.assertIsNone(result.remaining_family_slots)
-        self.assertIsNone(result.remaining_child_slots)
-        self.assertTrue(result.error_message.startswith("Failed to check workshop capacity:"))
+    })
+
+
+@pytest.fixture(scope="module")
+def use_case(workshop_repository):
+    """
+    Create the use case under test.
+    """
+    return PreventOverbookingUseCase(workshop_repository)
+
+
+@pytest.mark.parametrize(
+    "workshop_id, req_fam, req_ch, exp_capacity, exp_fam, exp_ch, exp_err_fragment, exp_err_exact, exp_code",
+    [
+        # Sufficient capacity: 10 max - 5 used families, 20 max - 10 used children
+        pytest.param(1, 2, 4, True, 5, 10, None, None, None, id="has_capacity"),
+        # Family slots full: 5 max - 5 used
+        pytest.param(
+            2, 1, 2, False, 0, 10, "Not enough family slots", None, ErrorCode.INSUFFICIENT_CAPACITY,
+            id="not_enough_family_slots"
+        ),
+        # Child slots full: 15 max - 15 used
+        pytest.param(
+            3, 1, 1, False, 5, 0, "Not enough child slots", None, ErrorCode.INSUFFICIENT_CAPACITY,
+            id="not_enough_child_slots"
+        ),
+        # Uses exactly the 1 family and 2 child slots left
+        pytest.param(4, 1, 2, True, 1, 2, None, None, None, id="exact_remaining_capacity"),
+        # Asks for 2 families when only 1 slot is left
+        pytest.param(
+            4, 2, 1, False, 1, 2, "Not enough family slots", None, ErrorCode.INSUFFICIENT_CAPACITY,
+            id="exceeding_capacity"
+        ),
+        pytest.param(
+            999, 1, 2, False, None, None, None, "Workshop with ID 999 not found", ErrorCode.NOT_FOUND,
+            id="workshop_not_found"
+        ),
+    ]
+)
+def test_capacity_check(use_case, workshop_id, req_fam, req_ch, exp_capacity, exp_fam, exp_ch, exp_err_fragment,
+                        exp_err_exact, exp_code):
+    """
+    Test booking requests against workshops with different remaining capacity.
+    """
+    input_dto = PreventOverbookingInputDTO(
+        workshop_id=workshop_id,
+        requested_family_slots=req_fam,
+        requested_child_slots=req_ch
+    )
+
+    # Execute the use case
+    result = use_case.execute(input_dto)
+
+    # Assertions
+    assert result.has_capacity is exp_capacity
+    assert result.remaining_family_slots == exp_fam
+    assert result.remaining_child_slots == exp_ch
+    assert result.error_code is exp_code
+    if exp_err_exact is not None:
+        assert result.error_message == exp_err_exact
+    elif exp_err_fragment is not None:
+        assert exp_err_fragment in result.error_message
+    else:
+        assert result.error_message is None
+
+
+@pytest.mark.parametrize(
+    "invalid_input",
+    [
+        PreventOverbookingInputDTO(workshop_id=0, requested_family_slots=1, requested_child_slots=2),
+        PreventOverbookingInputDTO(workshop_id=1, requested_family_slots=0, requested_child_slots=2),
+        PreventOverbookingInputDTO(workshop_id=1, requested_family_slots=1, requested_child_slots=0),
+    ],
+    ids=["zero_id", "zero_family_slots", "zero_child_slots"]
+)
+def test_invalid_input(use_case, invalid_input):
+    """
+    Test validation failures.
+    """
+    result = use_case.execute(invalid_input)
+
+    # Assertions
+    assert not result.has_capacity
+    assert result.remaining_family_slots is None
+    assert result.remaining_child_slots is None
+    assert result.error_message == "Invalid booking request data provided"
+    assert result.error_code is ErrorCode.INVALID_INPUT
+
+
+def test_repository_failure(use_case, workshop_repository):
+    """
+    Test handling of repository failures.
+    """
+    # Create valid input
+    input_dto = PreventOverbookingInputDTO(
+        workshop_id=1,
+        requested_family_slots=1,
+        requested_child_slots=2
+    )
+
+    # Execute the use case while the repository fails
+    with workshop_repository.failing():
+        result = use_case.execute(input_dto)
+
+    # Assertions
+    assert not result.has_capacity
+    assert result.remaining_family_slots is None
+    assert result.remaining_child_slots is None
+    assert result.error_code is ErrorCode.REPOSITORY_FAILURE
+
+
+def test_unexpected_error():
+    """
+    Test that errors raised outside the repository are not reported as repository failures.
+    """
+    # A stored object without the workshop methods fails inside the use case itself
+    use_case = PreventOverbookingUseCase(MockWorkshopRepository(workshops_map={1: object()}))
+    input_dto = PreventOverbookingInputDTO(
+        workshop_id=1,
+        requested_family_slots=1,
+        requested_child_slots=2
+    )
 
+    # Execute the use case
+    result = use_case.execute(input_dto)
 
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    # Assertions
+    assert not result.has_capacity
+    assert result.error_code is ErrorCode.UNEXPECTED_ERROR
+    assert result.error_message.startswith("Failed to check workshop capacity:")